@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import FastAPI, Request, Form
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
@@ -28,13 +30,22 @@ async def analyze(
     # Parse comparison URLs
     comparison_list = [url.strip() for url in comparison_urls.split(",") if url.strip()]
 
-    # --- Agent Simulations ---
-    keyword_result = keyword_analysis_agent(main_url)
-    content_result = content_analysis_agent(main_url)
-    visual_result = visualizer_agent(main_url)
-    manager_result = manager_ai_agent(main_url, comparison_list)
-    onpage_result = onpage_analysis_agent(main_url)
-    linkbuilding_result = link_building_agent(main_url)
+    # --- Agent Simulations (independent, so run concurrently) ---
+    (
+        keyword_result,
+        content_result,
+        visual_result,
+        manager_result,
+        onpage_result,
+        linkbuilding_result,
+    ) = await asyncio.gather(
+        keyword_analysis_agent(main_url),
+        content_analysis_agent(main_url),
+        visualizer_agent(main_url),
+        manager_ai_agent(main_url, comparison_list),
+        onpage_analysis_agent(main_url),
+        link_building_agent(main_url),
+    )
 
     results = {
         "main_url": main_url,
@@ -52,23 +63,23 @@ async def analyze(
 
 # ---------------- Agent Functions ---------------- #
 
-def keyword_analysis_agent(url: str) -> str:
+async def keyword_analysis_agent(url: str) -> str:
     return f"Extracted primary keywords from {url} and identified keyword density."
 
-def content_analysis_agent(url: str) -> str:
+async def content_analysis_agent(url: str) -> str:
     return f"Analyzed text content of {url} for SEO quality, headings, and readability."
 
-def visualizer_agent(url: str) -> str:
+async def visualizer_agent(url: str) -> str:
     return f"Created visual summary for {url}'s SEO metrics (placeholder)."
 
-def manager_ai_agent(url: str, comparisons: list) -> str:
+async def manager_ai_agent(url: str, comparisons: list) -> str:
     if comparisons:
         return f"Compared {url} with {len(comparisons)} competitor URLs and summarized findings."
     else:
         return "No comparison URLs provided. Manager AI focused on the main URL only."
 
-def onpage_analysis_agent(url: str) -> str:
+async def onpage_analysis_agent(url: str) -> str:
     return f"Checked {url} for meta tags, image alt texts, and internal link structure."
 
-def link_building_agent(url: str) -> str:
+async def link_building_agent(url: str) -> str:
     return f"Suggested potential backlinks and outreach strategies for {url}."